@@ -1,7 +1,9 @@
 import express, { Request, Response } from 'express';
 import { fetchAllMeetings, filterMeetingsByDate, sortMeetingsByDate } from '../services/councilMeetingsService.js';
 import { GeminiService } from '../services/gemini.service.js';
+import { extractMeetingText, getCachedDecisions, cacheDecisions } from '../services/pdfExtractorService.js';
 import type { MeetingRecord } from '../types/meeting.js';
+import type { MeetingDecision } from '../types/gemini.js';
 
 const router = express.Router();
 
@@ -42,9 +44,9 @@ router.get('/meetings', async (req: Request, res: Response) => {
   res.setHeader('Access-Control-Allow-Origin', '*');
   res.flushHeaders();
 
+  // Serialize each event once and emit it as a single chunk
   const sendEvent = (event: string, data: any) => {
-    res.write(`event: ${event}\n`);
-    res.write(`data: ${JSON.stringify(data)}\n\n`);
+    res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
   };
 
   try {
@@ -89,8 +91,6 @@ router.get('/meetings', async (req: Request, res: Response) => {
 
     // Worker function that processes meetings concurrently
     const worker = async () => {
-      const { extractMeetingText } = await import('../services/pdfExtractorService.js');
-      
       while (true) {
         // Atomically claim next meeting index
         const meetingIndex = currentIndex++;
@@ -102,23 +102,31 @@ router.get('/meetings', async (req: Request, res: Response) => {
         const meeting = sortedMeetings[meetingIndex];
         
         try {
-          let meetingWithDecisions: MeetingRecord = { ...meeting };
-
           // Extract PDF text
           const pdfText = await extractMeetingText(meeting);
-          
-          if (pdfText) {
-            meetingWithDecisions.pdfText = pdfText;
+          let decisions: MeetingDecision[] | undefined;
+
+          // Process with Gemini if available
+          if (pdfText && service) {
+            // Reuse decisions from an earlier request, so searches over
+            // overlapping date ranges only send new meetings to Gemini
+            decisions = getCachedDecisions(meeting.meetingUrl);
 
-            // Process with Gemini if available
-            if (service) {
+            if (decisions) {
+              console.log(`Meeting ${meeting.id}: Using cached decisions`);
+            } else {
               console.log(`Processing meeting ${meeting.id} (index ${meetingIndex}) with Gemini...`);
-              const decisions = await service.extractMeetingDecisions(pdfText);
-              meetingWithDecisions.decisions = decisions;
+              decisions = await service.extractMeetingDecisions(pdfText);
+              cacheDecisions(meeting.meetingUrl, decisions);
               console.log(`  Extracted ${decisions.length} decisions from meeting ${meeting.id}`);
             }
           }
 
+          // Build the result once; meetings without minutes are sent as-is
+          const meetingWithDecisions: MeetingRecord = pdfText
+            ? { ...meeting, pdfText, decisions }
+            : meeting;
+
           // Buffer result for sequential sending
           pendingResults.set(meetingIndex, meetingWithDecisions);
           sendPendingResults();
@@ -1,4 +1,4 @@
-import axios from 'axios';
+import { httpClient } from './httpClient.js';
 import { MeetingRecord, VancouverAPIMeeting } from '../types/meeting.js';
 
 const API_BASE_URL = process.env.VANCOUVER_API_BASE_URL || 'https://api.vancouver.ca/App/CouncilMeetings/CouncilMeetings.API/api';
@@ -16,61 +16,125 @@ const API_KEY_HEADERS: Record<string, string>[] = [
   { 'apikey': API_KEY },
 ];
 
+// Meeting listings are reused across requests for a short while instead of
+// re-fetching and re-parsing the full API response every time
+const MEETINGS_CACHE_TTL_MS = 10 * 60 * 1000;
+const meetingsCache = new Map<string, { meetings: Promise<MeetingRecord[]>; fetchedAt: number }>();
+
+// Validators from the last successful listing response, used to revalidate
+// an expired listing with a conditional GET instead of downloading it again
+const listingValidators = new Map<string, { etag?: string; lastModified?: string; meetings: MeetingRecord[] }>();
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// Working API key format, discovered once per process. Resolves to the
+// headers to send, or null when the key goes in the query string
+let apiKeyFormat: Promise<Record<string, string> | null> | null = null;
+
 /**
- * Test different API key header formats to find the correct one
+ * Test different API key header formats to find the correct one.
+ * All formats are probed concurrently and the first success wins.
  */
 async function testApiKeyFormat(): Promise<Record<string, string> | null> {
   const params = { type: 'previous' };
 
   console.log('Testing API key formats...');
 
-  // Try each header format
-  for (const headers of API_KEY_HEADERS) {
-    try {
-      const headerName = Object.keys(headers)[0];
-      console.log(`Trying header: ${headerName}`);
+  const headerProbes = API_KEY_HEADERS.map(async (headers) => {
+    const headerName = Object.keys(headers)[0];
 
-      const response = await axios.get(ENDPOINT, { params, headers, timeout: 10000 });
+    try {
+      const response = await httpClient.get(ENDPOINT, { params, headers, timeout: 10000 });
 
-      if (response.status === 200) {
-        console.log(`✓ Success! Working header: ${headerName}`);
-        return headers;
+      if (response.status !== 200) {
+        throw new Error(`Status code: ${response.status}`);
       }
+
+      console.log(`✓ Success! Working header: ${headerName}`);
+      return headers;
     } catch (error: any) {
       if (error.response) {
-        console.log(`  ✗ Status code: ${error.response.status}`);
+        console.log(`  ✗ ${headerName}: Status code: ${error.response.status}`);
       } else {
-        console.log(`  ✗ Error: ${error.message}`);
+        console.log(`  ✗ ${headerName}: ${error.message}`);
       }
+      throw error;
     }
-  }
+  });
 
   // Try as query parameter
-  console.log('\nTrying API key as query parameter...');
-  try {
-    const paramsWithKey = { ...params, apiKey: API_KEY };
-    const response = await axios.get(ENDPOINT, { params: paramsWithKey, timeout: 10000 });
+  const queryParamProbe = (async () => {
+    try {
+      const paramsWithKey = { ...params, apiKey: API_KEY };
+      const response = await httpClient.get(ENDPOINT, { params: paramsWithKey, timeout: 10000 });
+
+      if (response.status !== 200) {
+        throw new Error(`Status code: ${response.status}`);
+      }
 
-    if (response.status === 200) {
       console.log('✓ Success! API key works as query parameter');
       return null; // Return null to indicate query param should be used
+    } catch (error: any) {
+      console.log(`  ✗ Query parameter: ${error.message}`);
+      throw error;
     }
-  } catch (error: any) {
-    console.log(`  ✗ Error: ${error.message}`);
+  })();
+
+  return Promise.any([...headerProbes, queryParamProbe]);
+}
+
+/**
+ * Get the working API key format, probing only on first use. A failed
+ * probe is not cached, so the next call tries again.
+ */
+async function getApiKeyFormat(): Promise<Record<string, string> | null> {
+  if (!apiKeyFormat) {
+    apiKeyFormat = testApiKeyFormat();
   }
 
-  return null;
+  try {
+    return await apiKeyFormat;
+  } catch {
+    console.log('No API key format succeeded, falling back to query parameter');
+    apiKeyFormat = null;
+    return null;
+  }
 }
 
 /**
- * Fetch all meetings from the Vancouver API
+ * Fetch all meetings from the Vancouver API, reusing a recently fetched
+ * listing when one is available
  */
 export async function fetchAllMeetings(
   meetingType: string = 'previous'
 ): Promise<MeetingRecord[]> {
+  const cached = meetingsCache.get(meetingType);
+  if (cached && Date.now() - cached.fetchedAt < MEETINGS_CACHE_TTL_MS) {
+    console.log(`Reusing cached ${meetingType} meetings`);
+    return cached.meetings;
+  }
+
+  // Cache the pending promise so concurrent requests share a single fetch
+  const meetings = fetchMeetingsFromApi(meetingType);
+  const entry = { meetings, fetchedAt: Date.now() };
+  meetingsCache.set(meetingType, entry);
+
+  meetings.catch(() => {
+    if (meetingsCache.get(meetingType) === entry) {
+      meetingsCache.delete(meetingType);
+    }
+  });
+
+  return meetings;
+}
+
+/**
+ * Fetch and transform the meeting listing from the Vancouver API
+ */
+async function fetchMeetingsFromApi(meetingType: string): Promise<MeetingRecord[]> {
   try {
-    // Test API key format first
-    const workingHeaders = await testApiKeyFormat();
+    // Look up the API key format (probed on first use)
+    const workingHeaders = await getApiKeyFormat();
     const useQueryParam = workingHeaders === null;
 
     const params: any = { type: meetingType };
@@ -82,12 +146,27 @@ export async function fetchAllMeetings(
 
     console.log(`\nFetching all ${meetingType} meetings...`);
 
-    const response = await axios.get(ENDPOINT, {
+    const headers: Record<string, string> = { ...workingHeaders };
+    const previous = listingValidators.get(meetingType);
+    if (previous?.etag) {
+      headers['If-None-Match'] = previous.etag;
+    }
+    if (previous?.lastModified) {
+      headers['If-Modified-Since'] = previous.lastModified;
+    }
+
+    const response = await httpClient.get(ENDPOINT, {
       params,
-      headers: workingHeaders || undefined,
-      timeout: 30000
+      headers,
+      timeout: 30000,
+      validateStatus: status => (status >= 200 && status < 300) || status === 304
     });
 
+    if (response.status === 304 && previous) {
+      console.log(`✓ Meetings unchanged since last fetch (${previous.meetings.length} meetings)`);
+      return previous.meetings;
+    }
+
     if (response.status !== 200) {
       throw new Error(`API returned status ${response.status}`);
     }
@@ -117,6 +196,12 @@ export async function fetchAllMeetings(
       };
     });
 
+    const etag = response.headers['etag'] as string | undefined;
+    const lastModified = response.headers['last-modified'] as string | undefined;
+    if (etag || lastModified) {
+      listingValidators.set(meetingType, { etag, lastModified, meetings: transformedMeetings });
+    }
+
     console.log(`✓ Successfully fetched ${transformedMeetings.length} meetings`);
     return transformedMeetings;
 
@@ -138,29 +223,22 @@ export function filterMeetingsByDate(
     return meetings;
   }
 
+  // A meeting matches when the UTC date of its start falls within
+  // [startDate, endDate]. Converting the bounds to UTC timestamps once means
+  // each meeting needs a single parse and no string formatting
+  const startTime = startDate ? Date.parse(startDate) : -Infinity;
+  const endTime = endDate ? Date.parse(endDate) + DAY_MS : Infinity;
+
   return meetings.filter(meeting => {
     if (!meeting.eventDate) return false;
 
-    try {
-      // Parse ISO format date (e.g., "2026-01-15T18:00:00")
-      const eventDate = new Date(meeting.eventDate);
-      const eventDateOnly = eventDate.toISOString().split('T')[0];
+    // Parse ISO format date (e.g., "2026-01-15T18:00:00")
+    const eventTime = new Date(meeting.eventDate).getTime();
 
-      // Check start date
-      if (startDate && eventDateOnly < startDate) {
-        return false;
-      }
-
-      // Check end date
-      if (endDate && eventDateOnly > endDate) {
-        return false;
-      }
+    // Skip meetings with invalid dates
+    if (isNaN(eventTime)) return false;
 
-      return true;
-    } catch (error) {
-      // Skip meetings with invalid dates
-      return false;
-    }
+    return eventTime >= startTime && eventTime < endTime;
   });
 }
 
@@ -168,9 +246,9 @@ export function filterMeetingsByDate(
  * Sort meetings by date descending (most recent first)
  */
 export function sortMeetingsByDate(meetings: MeetingRecord[]): MeetingRecord[] {
-  return [...meetings].sort((a, b) => {
-    const dateA = new Date(a.eventDate).getTime();
-    const dateB = new Date(b.eventDate).getTime();
-    return dateB - dateA; // Descending order
-  });
+  // Parse each date once up front rather than twice per comparison
+  return meetings
+    .map(meeting => ({ meeting, time: new Date(meeting.eventDate).getTime() }))
+    .sort((a, b) => b.time - a.time) // Descending order
+    .map(({ meeting }) => meeting);
 }
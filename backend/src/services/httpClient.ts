@@ -0,0 +1,36 @@
+import axios, { AxiosError, InternalAxiosRequestConfig } from 'axios';
+import http from 'http';
+import https from 'https';
+
+const MAX_RETRIES = 3;
+const RETRY_BACKOFF_MS = 300;
+const RETRYABLE_STATUS_CODES = new Set([502, 503, 504]);
+
+/**
+ * Shared HTTP client with keep-alive agents so repeated requests to the
+ * same host reuse pooled sockets instead of opening a new TCP + TLS
+ * connection every time
+ */
+export const httpClient = axios.create({
+  httpAgent: new http.Agent({ keepAlive: true, maxSockets: 16 }),
+  httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 16 })
+});
+
+// Retry transient gateway errors with exponential backoff
+httpClient.interceptors.response.use(undefined, async (error: AxiosError) => {
+  const config = error.config as (InternalAxiosRequestConfig & { retryCount?: number }) | undefined;
+  const status = error.response?.status;
+
+  if (!config || !status || !RETRYABLE_STATUS_CODES.has(status)) {
+    throw error;
+  }
+
+  config.retryCount = (config.retryCount || 0) + 1;
+  if (config.retryCount > MAX_RETRIES) {
+    throw error;
+  }
+
+  const delay = RETRY_BACKOFF_MS * 2 ** (config.retryCount - 1);
+  await new Promise(resolve => setTimeout(resolve, delay));
+  return httpClient.request(config);
+});
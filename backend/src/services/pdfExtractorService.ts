@@ -1,10 +1,94 @@
-import axios from 'axios';
-import * as cheerio from 'cheerio';
-import pdfParse from 'pdf-parse';
+import { createHash } from 'crypto';
+import { Parser } from 'htmlparser2';
+// Import the library entry directly: the package index runs a debug harness
+// (reading a bundled sample PDF from disk) whenever module.parent is unset,
+// which is always the case when loaded from an ES module.
+import pdfParse from 'pdf-parse/lib/pdf-parse.js';
+import { httpClient } from './httpClient.js';
 import { MeetingRecord } from '../types/meeting.js';
+import type { MeetingDecision } from '../types/gemini.js';
 
-// Cache for extracted PDF texts to avoid re-processing
-const pdfTextCache = new Map<string, string>();
+// Cache for extracted PDF texts to avoid re-processing. Decisions extracted
+// from a text live in the same entry, so they are always cleared together.
+const pdfTextCache = new Map<string, { text: string; decisions?: MeetingDecision[] }>();
+
+// Extracted texts keyed by a hash of the PDF bytes, so identical minutes
+// reached through a different URL are not parsed again. Bump the version
+// whenever extraction changes so stale entries are ignored.
+const PDF_CONTENT_CACHE_VERSION = 1;
+const pdfContentCache = new Map<string, string>();
+
+// Minutes larger than this are abandoned mid-download rather than buffered
+const MAX_PDF_BYTES = 50 * 1024 * 1024;
+
+// Fast path for the usual markup: an <a href="..."> whose text (with no
+// nested tags) contains "read the minutes". Only ever tried once, anchored
+// at the <a that opens just before the phrase, so it cannot backtrack
+// across the page.
+const MINUTES_LINK_PATTERN = /<a\s(?:[^<>]*?\s)?href\s*=\s*(?:"([^"]*)"|'([^']*)')[^<>]*>[^<]*read the minutes[^<]*<\/a>/iy;
+
+// Anchors whose opening tag starts further back than this from the phrase
+// are left to the parser
+const MINUTES_LINK_WINDOW = 2000;
+
+/**
+ * Return the href of the first link on a meeting page whose text contains
+ * "read the minutes". Falls back to streaming the page through htmlparser2,
+ * stopping as soon as the link is found.
+ */
+function findMinutesLink(html: string): string | null {
+  // Usually the link can be read straight off the page: locate the first
+  // mention of the phrase and match the anchor that opens just before it.
+  // Because the match covers that first mention, document order is kept.
+  // Hrefs with character references other than &amp; go through the parser
+  // so they are decoded properly.
+  const firstMention = html.search(/read the minutes/i);
+  const anchorStart = firstMention >= 0 ? html.lastIndexOf('<a', firstMention) : -1;
+
+  if (anchorStart >= 0 && firstMention - anchorStart <= MINUTES_LINK_WINDOW) {
+    MINUTES_LINK_PATTERN.lastIndex = anchorStart;
+    const match = MINUTES_LINK_PATTERN.exec(html);
+    const href = match ? match[1] ?? match[2] : undefined;
+
+    if (href && !/&(?!amp;)/.test(href)) {
+      return href.replace(/&amp;/g, '&');
+    }
+  }
+
+  let minutesLink = null as string | null;
+  let currentHref: string | null = null;
+  let linkText = '';
+
+  const parser = new Parser({
+    onopentag(name, attributes) {
+      if (name === 'a' && attributes.href) {
+        currentHref = attributes.href;
+        linkText = '';
+      }
+    },
+    ontext(text) {
+      if (currentHref !== null) {
+        linkText += text;
+      }
+    },
+    onclosetag(name) {
+      if (name !== 'a' || currentHref === null) return;
+
+      if (linkText.toLowerCase().includes('read the minutes')) {
+        minutesLink = currentHref;
+        parser.pause(); // Stop tokenizing the rest of the page
+      }
+      currentHref = null;
+    }
+  }, { decodeEntities: true });
+
+  parser.write(html);
+  if (!minutesLink) {
+    parser.end();
+  }
+
+  return minutesLink;
+}
 
 /**
  * Extract text from a single meeting's PDF minutes
@@ -19,15 +103,16 @@ export async function extractMeetingText(meeting: MeetingRecord): Promise<string
   }
 
   // Check cache first
-  if (pdfTextCache.has(meetingUrl)) {
+  const cached = pdfTextCache.get(meetingUrl);
+  if (cached) {
     console.log(`Meeting ${id}: Using cached PDF text`);
-    return pdfTextCache.get(meetingUrl)!;
+    return cached.text;
   }
 
   try {
     // Step 1: Fetch the meeting page HTML
     console.log(`Meeting ${id}: Fetching page...`);
-    const pageResponse = await axios.get(meetingUrl, { timeout: 30000 });
+    const pageResponse = await httpClient.get(meetingUrl, { timeout: 30000 });
 
     if (pageResponse.status === 404) {
       console.log(`Meeting ${id}: Page not found (404)`);
@@ -40,16 +125,7 @@ export async function extractMeetingText(meeting: MeetingRecord): Promise<string
     }
 
     // Step 2: Parse HTML and find "read the minutes" link
-    const $ = cheerio.load(pageResponse.data);
-    let minutesLink: string | null = null;
-
-    $('a').each((_, element) => {
-      const linkText = $(element).text().trim().toLowerCase();
-      if (linkText.includes('read the minutes')) {
-        minutesLink = $(element).attr('href') || null;
-        return false; // Break the loop
-      }
-    });
+    const minutesLink = findMinutesLink(pageResponse.data);
 
     if (!minutesLink) {
       console.log(`Meeting ${id}: No 'read the minutes' link found`);
@@ -58,11 +134,10 @@ export async function extractMeetingText(meeting: MeetingRecord): Promise<string
 
     // Step 3: Construct full PDF URL
     let pdfUrl: string;
-    const link = minutesLink as string;
-    if (link.startsWith('http')) {
-      pdfUrl = link;
-    } else if (link.startsWith('/')) {
-      pdfUrl = `https://council.vancouver.ca${link}`;
+    if (minutesLink.startsWith('http')) {
+      pdfUrl = minutesLink;
+    } else if (minutesLink.startsWith('/')) {
+      pdfUrl = `https://council.vancouver.ca${minutesLink}`;
     } else {
       // Relative URL - construct from meeting URL base
       const baseUrl = meetingUrl.substring(0, meetingUrl.lastIndexOf('/'));
@@ -72,9 +147,11 @@ export async function extractMeetingText(meeting: MeetingRecord): Promise<string
     console.log(`Meeting ${id}: Downloading PDF from ${pdfUrl}`);
 
     // Step 4: Download PDF
-    const pdfResponse = await axios.get(pdfUrl, {
+    // In Node, axios delivers an 'arraybuffer' response as a Buffer
+    const pdfResponse = await httpClient.get<Buffer>(pdfUrl, {
       timeout: 60000,
-      responseType: 'arraybuffer'
+      responseType: 'arraybuffer',
+      maxContentLength: MAX_PDF_BYTES
     });
 
     if (pdfResponse.status !== 200) {
@@ -82,10 +159,17 @@ export async function extractMeetingText(meeting: MeetingRecord): Promise<string
       return null;
     }
 
+    const contentKey = `v${PDF_CONTENT_CACHE_VERSION}:${createHash('sha256').update(pdfResponse.data).digest('hex')}`;
+    const cachedText = pdfContentCache.get(contentKey);
+    if (cachedText) {
+      console.log(`Meeting ${id}: PDF content already extracted, reusing text`);
+      pdfTextCache.set(meetingUrl, { text: cachedText });
+      return cachedText;
+    }
+
     // Step 5: Extract text from PDF using pdf-parse
     console.log(`Meeting ${id}: Extracting text from PDF...`);
-    const pdfBuffer = Buffer.from(pdfResponse.data);
-    const pdfData = await pdfParse(pdfBuffer);
+    const pdfData = await pdfParse(pdfResponse.data);
 
     if (!pdfData.text || pdfData.text.trim().length === 0) {
       console.log(`Meeting ${id}: No text extracted from PDF`);
@@ -96,7 +180,8 @@ export async function extractMeetingText(meeting: MeetingRecord): Promise<string
     console.log(`Meeting ${id}: Successfully extracted ${pdfData.numpages} pages, ${extractedText.length} characters`);
 
     // Cache the result
-    pdfTextCache.set(meetingUrl, extractedText);
+    pdfTextCache.set(meetingUrl, { text: extractedText });
+    pdfContentCache.set(contentKey, extractedText);
 
     return extractedText;
 
@@ -155,9 +240,28 @@ export async function extractMultipleMeetingsText(
 }
 
 /**
- * Clear the PDF text cache
+ * Get decisions previously extracted from a meeting's cached PDF text
+ */
+export function getCachedDecisions(meetingUrl: string): MeetingDecision[] | undefined {
+  return pdfTextCache.get(meetingUrl)?.decisions;
+}
+
+/**
+ * Cache decisions extracted from a meeting's PDF text. Ignored when the text
+ * itself is no longer cached, so decisions never outlive their source text.
+ */
+export function cacheDecisions(meetingUrl: string, decisions: MeetingDecision[]): void {
+  const cached = pdfTextCache.get(meetingUrl);
+  if (cached) {
+    cached.decisions = decisions;
+  }
+}
+
+/**
+ * Clear the PDF text cache, along with any decisions extracted from it
  */
 export function clearCache(): void {
   pdfTextCache.clear();
+  pdfContentCache.clear();
   console.log('PDF text cache cleared');
 }
@@ -1,4 +1,4 @@
-import { useState, useRef } from 'react'
+import { useState, useRef, useMemo } from 'react'
 import Map from './components/Map'
 import { Splash, DateRangeFilter } from './components/Common'
 import type { DateRangeFilterRef } from './components/Common/DateRangeFilter'
@@ -32,6 +32,19 @@ export interface DecisionWithContext extends MeetingDecision {
   meetingUrl: string;
 }
 
+// Helper to calculate distance
+const getDistanceFromLatLonInKm = (lat1: number, lon1: number, lat2: number, lon2: number) => {
+  const R = 6371; // Radius of the earth in km
+  const dLat = (lat2 - lat1) * (Math.PI / 180);
+  const dLon = (lon2 - lon1) * (Math.PI / 180);
+  const a =
+    Math.sin(dLat / 2) * Math.sin(dLat / 2) +
+    Math.cos(lat1 * (Math.PI / 180)) * Math.cos(lat2 * (Math.PI / 180)) *
+    Math.sin(dLon / 2) * Math.sin(dLon / 2);
+  const c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
+  return R * c;
+};
+
 function App() {
   const [userLocation, setUserLocation] = useState<[number, number] | null>(null);
   const [decisions, setDecisions] = useState<DecisionWithContext[]>([]);
@@ -44,27 +57,15 @@ function App() {
   const dateFilterRef = useRef<DateRangeFilterRef | null>(null);
   const [maxDistance, setMaxDistance] = useState<number | null>(null);
 
-  // Helper to calculate distance
-  const getDistanceFromLatLonInKm = (lat1: number, lon1: number, lat2: number, lon2: number) => {
-    const R = 6371; // Radius of the earth in km
-    const dLat = (lat2 - lat1) * (Math.PI / 180);
-    const dLon = (lon2 - lon1) * (Math.PI / 180);
-    const a =
-      Math.sin(dLat / 2) * Math.sin(dLat / 2) +
-      Math.cos(lat1 * (Math.PI / 180)) * Math.cos(lat2 * (Math.PI / 180)) *
-      Math.sin(dLon / 2) * Math.sin(dLon / 2);
-    const c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
-    return R * c;
-  };
-
-  const filteredDecisions = decisions.filter(d => {
+  // Memoized so children only see a new array when the inputs change
+  const filteredDecisions = useMemo(() => decisions.filter(d => {
     if (!maxDistance || !userLocation || !d.location) return true;
     const dist = getDistanceFromLatLonInKm(
       userLocation[0], userLocation[1],
       d.location[0], d.location[1]
     );
     return dist <= maxDistance;
-  });
+  }), [decisions, maxDistance, userLocation]);
 
   const handleFilter = (startDate: string, endDate: string) => {
     // Close any existing connection
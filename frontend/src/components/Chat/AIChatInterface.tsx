@@ -1,4 +1,4 @@
-import { useState, useRef, useEffect } from 'react';
+import { useState, useRef, useEffect, useMemo } from 'react';
 import { IoClose, IoTrash, IoSend, IoSparkles } from 'react-icons/io5';
 import ReactMarkdown from 'react-markdown';
 import type { DecisionWithContext } from '../../App';
@@ -135,8 +135,14 @@ export default function AIChatInterface({
     sendMessage(question);
   };
 
+  // Index decisions once per update so reference lookups during render are O(1)
+  const decisionsById = useMemo(
+    () => new Map(decisions.map(d => [d.decisionId, d])),
+    [decisions]
+  );
+
   const getDecisionById = (decisionId: string): DecisionWithContext | undefined => {
-    return decisions.find(d => d.decisionId === decisionId);
+    return decisionsById.get(decisionId);
   };
 
   const handleReferenceClick = (decisionId: string) => {
@@ -1,5 +1,5 @@
 import { MapContainer, TileLayer, Marker, useMap } from 'react-leaflet'
-import { useEffect, useState, useRef } from 'react'
+import { useEffect, useState, useRef, useMemo } from 'react'
 import 'leaflet/dist/leaflet.css'
 import L from 'leaflet'
 import type { DecisionWithContext } from '../../App'
@@ -16,6 +16,8 @@ L.Icon.Default.mergeOptions({
   shadowUrl: 'https://cdnjs.cloudflare.com/ajax/libs/leaflet/1.9.4/images/marker-shadow.png',
 })
 
+type LocatedDecision = DecisionWithContext & { location: [number, number] }
+
 interface DateRangeContext {
   startDate: string | null
   endDate: string | null
@@ -38,23 +40,17 @@ function MapBoundsHandler({
   decisions 
 }: { 
   userLocation: [number, number], 
-  decisions: DecisionWithContext[] 
+  decisions: LocatedDecision[] 
 }) {
   const map = useMap()
 
   useEffect(() => {
-    // Filter decisions that have valid locations
-    const decisionsWithLocations = decisions.filter(
-      (d): d is DecisionWithContext & { location: [number, number] } => 
-        d.location !== null && Array.isArray(d.location) && d.location.length === 2
-    )
-
     // If we have decisions with locations, adjust bounds to fit all points
-    if (decisionsWithLocations.length > 0) {
+    if (decisions.length > 0) {
       const bounds = L.latLngBounds([userLocation])
       
       // Add all decision locations to bounds
-      decisionsWithLocations.forEach(decision => {
+      decisions.forEach(decision => {
         bounds.extend(decision.location)
       })
 
@@ -125,10 +121,14 @@ export default function Map({
   const [newMarkers, setNewMarkers] = useState<Set<string>>(new Set())
   const prevDecisionIdsRef = useRef<Set<string>>(new Set())
 
-  // Filter decisions that have valid locations
-  const decisionsWithLocations = decisions.filter(
-    (d): d is DecisionWithContext & { location: [number, number] } => 
-      d.location !== null && Array.isArray(d.location) && d.location.length === 2
+  // Filter decisions that have valid locations once per update; the markers,
+  // the new-marker tracking and the bounds handler all share this list
+  const decisionsWithLocations = useMemo(
+    () => decisions.filter(
+      (d): d is LocatedDecision => 
+        d.location !== null && Array.isArray(d.location) && d.location.length === 2
+    ),
+    [decisions]
   )
 
   // Track new markers and trigger pop animation
@@ -196,7 +196,7 @@ export default function Map({
         />
         
         {/* Component to handle automatic bounds adjustment */}
-        <MapBoundsHandler userLocation={userLocation} decisions={decisions} />
+        <MapBoundsHandler userLocation={userLocation} decisions={decisionsWithLocations} />
         
         {/* Custom map controls */}
         <MapControls userLocation={userLocation} />